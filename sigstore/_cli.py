@@ -20,6 +20,7 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, NoReturn, Optional, TextIO, Union
@@ -57,7 +58,7 @@ from sigstore.oidc import (
     Issuer,
     detect_credential,
 )
-from sigstore.sign import SigningContext
+from sigstore.sign import Signer, SigningContext
 from sigstore.verify import (
     Verifier,
     policy,
@@ -74,6 +75,11 @@ _logger = logging.getLogger(__name__)
 _package_logger = logging.getLogger("sigstore")
 _package_logger.setLevel(os.environ.get("SIGSTORE_LOGLEVEL", "INFO").upper())
 
+# The maximum number of inputs signed concurrently. Signing each input is
+# dominated by network round-trips (e.g. to Rekor), so we overlap them; this
+# stays within the connection pool size of each client's session.
+_MAX_SIGNING_WORKERS = 8
+
 
 @dataclass(frozen=True)
 class SigningOutputs:
@@ -669,66 +675,109 @@ def _sign_common(
     if not identity:
         _invalid_arguments(args, "No identity token supplied or detected!")
 
-    with signing_ctx.signer(identity) as signer:
-        for file, outputs in output_map.items():
-            _logger.debug(f"signing for {file.name}")
-            with file.open(mode="rb") as io:
-                # The input can be indefinitely large, so we perform a streaming
-                # digest and sign the prehash rather than buffering it fully.
-                digest = sha256_digest(io)
-            try:
-                if predicate is None:
-                    result = signer.sign_artifact(input_=digest)
-                else:
-                    subject = Subject(
-                        name=file.name, digest={"sha256": digest.digest.hex()}
-                    )
-                    predicate_type = args.predicate_type
-                    statement_builder = StatementBuilder(
-                        subjects=[subject],
-                        predicate_type=predicate_type,
-                        predicate=predicate,
-                    )
-                    result = signer.sign_dsse(statement_builder.build())
-            except ExpiredIdentity as exp_identity:
-                print("Signature failed: identity token has expired")
-                raise exp_identity
-
-            except ExpiredCertificate as exp_certificate:
-                print("Signature failed: Fulcio signing certificate has expired")
-                raise exp_certificate
-
-            print("Using ephemeral certificate:")
-            cert = result.signing_certificate
-            cert_pem = cert.public_bytes(Encoding.PEM).decode()
-            print(cert_pem)
-
-            print(
-                f"Transparency log entry created at index: {result.log_entry.log_index}"
-            )
+    def _sign_file(signer: Signer, file: Path) -> Bundle:
+        _logger.debug(f"signing for {file.name}")
+        with file.open(mode="rb") as io:
+            # The input can be indefinitely large, so we perform a streaming
+            # digest and sign the prehash rather than buffering it fully.
+            digest = sha256_digest(io)
 
-            sig_output: TextIO
-            if outputs.signature is not None:
-                sig_output = outputs.signature.open("w")
-            else:
-                sig_output = sys.stdout
-
-            signature = base64.b64encode(
-                result._inner.message_signature.signature
-            ).decode()
-            print(signature, file=sig_output)
-            if outputs.signature is not None:
-                print(f"Signature written to {outputs.signature}")
-
-            if outputs.certificate is not None:
-                with outputs.certificate.open(mode="w") as io:
-                    print(cert_pem, file=io)
-                print(f"Certificate written to {outputs.certificate}")
-
-            if outputs.bundle is not None:
-                with outputs.bundle.open(mode="w") as io:
-                    print(result.to_json(), file=io)
-                print(f"Sigstore bundle written to {outputs.bundle}")
+        if predicate is None:
+            return signer.sign_artifact(input_=digest)
+        else:
+            subject = Subject(name=file.name, digest={"sha256": digest.digest.hex()})
+            predicate_type = args.predicate_type
+            statement_builder = StatementBuilder(
+                subjects=[subject],
+                predicate_type=predicate_type,
+                predicate=predicate,
+            )
+            return signer.sign_dsse(statement_builder.build())
+
+    with (
+        signing_ctx.signer(identity) as signer,
+        ThreadPoolExecutor(
+            max_workers=min(len(output_map), _MAX_SIGNING_WORKERS)
+        ) as executor,
+    ):
+        # Sign each input concurrently, but emit the results in input order.
+        #
+        # NOTE: Each input that is signed has a transparency log entry
+        # created for it. If signing fails or is interrupted, we stop signing
+        # the inputs that haven't started yet, but we always wait for every
+        # input that has started and emit each success before re-raising.
+        # Otherwise, published signatures could be silently discarded.
+        pending: list[tuple[SigningOutputs, Future[Bundle]]] = []
+        handled = 0
+        first_error: Exception | None = None
+        try:
+            for file, outputs in output_map.items():
+                pending.append((outputs, executor.submit(_sign_file, signer, file)))
+
+            for outputs, future in pending:
+                result: Bundle | None = None
+                try:
+                    result = future.result()
+                except CancelledError:
+                    pass
+                except Exception as exc:
+                    if first_error is None:
+                        first_error = exc
+                        if isinstance(exc, ExpiredIdentity):
+                            print("Signature failed: identity token has expired")
+                        elif isinstance(exc, ExpiredCertificate):
+                            print(
+                                "Signature failed: Fulcio signing certificate has expired"
+                            )
+                        for _, remaining in pending:
+                            remaining.cancel()
+
+                # Count the input as handled before emitting its outputs, so
+                # that an interrupted emission isn't repeated below.
+                handled += 1
+                if result is not None:
+                    _emit_signing_outputs(result, outputs)
+        except BaseException:
+            # If we're interrupted (e.g. with Ctrl-C), don't sign any inputs
+            # that haven't started yet, but emit the ones that were signed.
+            executor.shutdown(wait=True, cancel_futures=True)
+            for outputs, future in pending[handled:]:
+                if not future.cancelled() and future.exception() is None:
+                    _emit_signing_outputs(future.result(), outputs)
+            raise
+
+        if first_error is not None:
+            raise first_error
+
+
+def _emit_signing_outputs(result: Bundle, outputs: SigningOutputs) -> None:
+    print("Using ephemeral certificate:")
+    cert = result.signing_certificate
+    cert_pem = cert.public_bytes(Encoding.PEM).decode()
+    print(cert_pem)
+
+    print(f"Transparency log entry created at index: {result.log_entry.log_index}")
+
+    sig_output: TextIO
+    if outputs.signature is not None:
+        sig_output = outputs.signature.open("w")
+    else:
+        sig_output = sys.stdout
+
+    signature = base64.b64encode(result._inner.message_signature.signature).decode()
+    print(signature, file=sig_output)
+    if outputs.signature is not None:
+        print(f"Signature written to {outputs.signature}")
+
+    if outputs.certificate is not None:
+        with outputs.certificate.open(mode="w") as io:
+            print(cert_pem, file=io)
+        print(f"Certificate written to {outputs.certificate}")
+
+    if outputs.bundle is not None:
+        with outputs.bundle.open(mode="w") as io:
+            print(result.to_json(), file=io)
+        print(f"Sigstore bundle written to {outputs.bundle}")
 
 
 def _attest(args: argparse.Namespace) -> None:
@@ -19,8 +19,46 @@ Everything in these APIs is considered internal and unstable, and is not
 subject to any stability guarantees.
 """
 
+from requests import Session
 from requests import __version__ as requests_version
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from sigstore import __version__ as sigstore_version
 
 USER_AGENT = f"sigstore-python/{sigstore_version} (python-requests/{requests_version})"
+
+
+def mount_http_adapter(session: Session) -> None:
+    """
+    Mounts a new `HTTPAdapter` on the given network client's session, for both
+    HTTPS and HTTP.
+
+    Signing and verification are dominated by network round-trips rather than
+    computation, so the adapter keeps a bounded pool of keep-alive connections
+    around and retries transient failures. Connection failures are retried for
+    every request, since nothing has been sent yet; server-side (5xx) failures
+    are only retried for idempotent requests, so that requests that create
+    state (like Fulcio certificate issuance or Rekor entry creation) aren't
+    repeated.
+
+    Read timeouts aren't retried and `Retry-After` headers aren't honored, so
+    a slow or overloaded server can't stall a client for much longer than its
+    own request timeout.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            read=0,
+            status_forcelist=(500, 502, 503, 504),
+            respect_retry_after_header=False,
+            # Surface the final response, so that each client's own error
+            # handling (via `raise_for_status`) still applies.
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
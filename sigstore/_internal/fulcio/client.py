@@ -31,10 +31,10 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.x509 import (
     Certificate,
     CertificateSigningRequest,
-    load_pem_x509_certificate,
+    load_pem_x509_certificates,
 )
 
-from sigstore._internal import USER_AGENT
+from sigstore._internal import USER_AGENT, mount_http_adapter
 from sigstore._utils import B64Str
 from sigstore.oidc import IdentityToken
 
@@ -79,13 +79,36 @@ class _Endpoint(ABC):
         self.session = session
 
 
-def _serialize_cert_request(req: CertificateSigningRequest) -> str:
+def _serialize_cert_request(req: CertificateSigningRequest) -> bytes:
     data = {
         "certificateSigningRequest": B64Str(
             base64.b64encode(req.public_bytes(serialization.Encoding.PEM)).decode()
         )
     }
-    return json.dumps(data)
+    # NOTE: We hand `requests` the encoded body directly, rather than a `str`
+    # that it would otherwise need to encode on our behalf.
+    return json.dumps(data).encode()
+
+
+def _load_pem_chain(certificates: List[str]) -> List[Certificate]:
+    """
+    Loads a list of PEM-encoded certificates in a single pass, rather than
+    parsing each certificate individually.
+    """
+    try:
+        chain = load_pem_x509_certificates("\n".join(certificates).encode())
+    except ValueError as exc:
+        raise FulcioClientError("Fulcio returned malformed certificates") from exc
+
+    # The combined parse skips over anything that isn't a PEM-encoded
+    # certificate, so we check that nothing was dropped along the way.
+    if len(chain) != len(certificates):
+        raise FulcioClientError(
+            f"Fulcio returned malformed certificates: expected {len(certificates)}, "
+            f"parsed {len(chain)}"
+        )
+
+    return chain
 
 
 class FulcioSigningCert(_Endpoint):
@@ -131,8 +154,7 @@ class FulcioSigningCert(_Endpoint):
             raise FulcioClientError(
                 f"Certificate chain is too short: {len(certificates)} < 2"
             )
-        cert = load_pem_x509_certificate(certificates[0].encode())
-        chain = [load_pem_x509_certificate(c.encode()) for c in certificates[1:]]
+        cert, *chain = _load_pem_chain(certificates)
 
         return FulcioCertificateSigningResponse(cert, chain)
 
@@ -151,13 +173,10 @@ class FulcioTrustBundle(_Endpoint):
             raise FulcioClientError from http_error
 
         trust_bundle_json = resp.json()
-        chains: List[List[Certificate]] = []
-        for certificate_chain in trust_bundle_json["chains"]:
-            chain: List[Certificate] = []
-            for certificate in certificate_chain["certificates"]:
-                cert: Certificate = load_pem_x509_certificate(certificate.encode())
-                chain.append(cert)
-            chains.append(chain)
+        chains: List[List[Certificate]] = [
+            _load_pem_chain(certificate_chain["certificates"])
+            for certificate_chain in trust_bundle_json["chains"]
+        ]
         return FulcioTrustBundleResponse(chains)
 
 
@@ -175,6 +194,8 @@ class FulcioClient:
             }
         )
 
+        mount_http_adapter(self.session)
+
     def __del__(self) -> None:
         """
         Destroys the underlying network session.
@@ -151,6 +151,7 @@ class _OAuthRedirectHandler(http.server.BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(body)
             server.auth_response = urllib.parse.parse_qs(r.query)
+            server.auth_response_ready.set()
         elif r.path == server.auth_request_path:
             self.send_response(302)
             self.send_header("Location", server.auth_endpoint)
@@ -219,6 +220,7 @@ class _OAuthRedirectServer(http.server.HTTPServer):
         super().__init__(("localhost", 0), _OAuthRedirectHandler)
         self.oauth_session = _OAuthSession(client_id, client_secret, issuer)
         self.auth_response: Optional[Dict[str, List[str]]] = None
+        self.auth_response_ready = threading.Event()
         self._is_out_of_band = False
 
     @property
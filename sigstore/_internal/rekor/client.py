@@ -28,7 +28,7 @@ from urllib.parse import urljoin
 import rekor_types
 import requests
 
-from sigstore._internal import USER_AGENT
+from sigstore._internal import USER_AGENT, mount_http_adapter
 from sigstore.models import LogEntry
 
 _logger = logging.getLogger(__name__)
@@ -236,6 +236,8 @@ class RekorClient:
             }
         )
 
+        mount_http_adapter(self.session)
+
     def __del__(self) -> None:
         """
         Terminates the underlying network session.
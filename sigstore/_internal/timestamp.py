@@ -27,7 +27,7 @@ from rfc3161_client import (
     decode_timestamp_response,
 )
 
-from sigstore._internal import USER_AGENT
+from sigstore._internal import USER_AGENT, mount_http_adapter
 
 CLIENT_TIMEOUT: int = 5
 
@@ -75,6 +75,8 @@ class TimestampAuthorityClient:
             }
         )
 
+        mount_http_adapter(self.session)
+
     def __del__(self) -> None:
         """
         Terminates the underlying network session.
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
 import time
 import urllib.parse
 import webbrowser
@@ -31,7 +32,7 @@ import jwt
 import requests
 from pydantic import BaseModel, StrictStr
 
-from sigstore._internal import USER_AGENT
+from sigstore._internal import USER_AGENT, mount_http_adapter
 from sigstore.errors import Error, NetworkError
 
 DEFAULT_OAUTH_ISSUER_URL = "https://oauth2.sigstore.dev/auth"
@@ -46,6 +47,8 @@ _KNOWN_OIDC_ISSUERS = {
 }
 _DEFAULT_AUDIENCE = "sigstore"
 
+_logger = logging.getLogger(__name__)
+
 
 class _OpenIDConfiguration(BaseModel):
     """
@@ -59,6 +62,16 @@ class _OpenIDConfiguration(BaseModel):
     token_endpoint: StrictStr
 
 
+# OpenID Connect configurations change rarely, so we keep each issuer's
+# configuration around for a short while (in seconds) rather than
+# re-retrieving it every time an `Issuer` is created. At most a handful of
+# issuers are cached at once.
+_OIDC_CONFIG_TTL = 300
+_OIDC_CONFIG_CACHE_MAXSIZE = 8
+_OIDC_CONFIG_CACHE: dict[str, tuple[float, _OpenIDConfiguration]] = {}
+_OIDC_CONFIG_CACHE_LOCK = threading.Lock()
+
+
 class ExpiredIdentity(Exception):
     """An error raised when an identity token is expired."""
 
@@ -248,6 +261,22 @@ class Issuer:
         """
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": USER_AGENT})
+        mount_http_adapter(self.session)
+
+        self.oidc_config = self._openid_configuration(base_url)
+
+    def _openid_configuration(self, base_url: str) -> _OpenIDConfiguration:
+        """
+        Retrieves the OpenID Connect configuration for the given base URL,
+        reusing a recently retrieved configuration when one is available.
+        """
+        with _OIDC_CONFIG_CACHE_LOCK:
+            cached = _OIDC_CONFIG_CACHE.get(base_url)
+        if cached is not None:
+            expiry, oidc_config = cached
+            if time.monotonic() < expiry:
+                _logger.debug(f"using cached OIDC configuration for {base_url}")
+                return oidc_config
 
         oidc_config_url = urllib.parse.urljoin(
             f"{base_url}/", ".well-known/openid-configuration"
@@ -267,10 +296,26 @@ class Issuer:
             # We don't generally expect this to fail (since the provider should
             # return a non-success HTTP code which we catch above), but we
             # check just in case we have a misbehaving OIDC issuer.
-            self.oidc_config = _OpenIDConfiguration.model_validate(resp.json())
+            oidc_config = _OpenIDConfiguration.model_validate(resp.json())
         except ValueError as exc:
             raise IssuerError(f"OIDC issuer returned invalid configuration: {exc}")
 
+        # Evict any expired configurations, as well as the oldest cached
+        # configurations if we're at capacity.
+        # The lock keeps concurrently created `Issuer`s from evicting the same
+        # entry twice.
+        with _OIDC_CONFIG_CACHE_LOCK:
+            now = time.monotonic()
+            _OIDC_CONFIG_CACHE.pop(base_url, None)
+            for url, (expiry, _) in list(_OIDC_CONFIG_CACHE.items()):
+                if expiry <= now:
+                    del _OIDC_CONFIG_CACHE[url]
+            while len(_OIDC_CONFIG_CACHE) >= _OIDC_CONFIG_CACHE_MAXSIZE:
+                del _OIDC_CONFIG_CACHE[next(iter(_OIDC_CONFIG_CACHE))]
+
+            _OIDC_CONFIG_CACHE[base_url] = (now + _OIDC_CONFIG_TTL, oidc_config)
+        return oidc_config
+
     @classmethod
     def production(cls) -> Issuer:
         """
@@ -319,9 +364,15 @@ class Issuer:
                 )
 
             if not server.is_oob():
-                # Wait until the redirect server populates the response
-                while server.auth_response is None:
-                    time.sleep(0.1)
+                # Wait until the redirect server populates the response.
+                # NOTE: We wait in bounded increments rather than indefinitely,
+                # since an unbounded `Event.wait` can't be interrupted
+                # (e.g. with Ctrl-C) on all platforms.
+                while not server.auth_response_ready.wait(timeout=1):
+                    pass
+
+                if server.auth_response is None:
+                    raise IdentityError("internal error: missing OAuth auth response")
 
                 auth_error = server.auth_response.get("error")
                 if auth_error is not None:
@@ -419,9 +470,48 @@ class IdentityError(Error):
             """
 
 
+# Detecting an ambient credential typically involves a round-trip to a metadata
+# service, so we reuse a detected credential until it's within this many seconds
+# of expiring.
+_AMBIENT_CREDENTIAL_LEEWAY = 60
+_AMBIENT_CREDENTIAL: Optional[str] = None
+
+
+def _credential_still_valid(token: str) -> bool:
+    """
+    Returns whether the given (unverified) OIDC token is comfortably within
+    its self-stated validity period.
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+        exp = claims["exp"]
+    except (jwt.PyJWTError, KeyError):
+        return False
+
+    # NOTE: `bool` is a subclass of `int`, so we reject it explicitly.
+    if isinstance(exp, bool) or not isinstance(exp, (int, float)):
+        return False
+
+    expiry: float = exp
+    return expiry > time.time() + _AMBIENT_CREDENTIAL_LEEWAY
+
+
 def detect_credential() -> Optional[str]:
-    """Calls `id.detect_credential`, but wraps exceptions with our own exception type."""
+    """
+    Calls `id.detect_credential`, but wraps exceptions with our own exception type.
+
+    A previously detected credential is returned instead if it isn't close to
+    expiring.
+    """
+    global _AMBIENT_CREDENTIAL
+
+    if _AMBIENT_CREDENTIAL is not None and _credential_still_valid(_AMBIENT_CREDENTIAL):
+        return _AMBIENT_CREDENTIAL
+
     try:
-        return cast(Optional[str], id.detect_credential(_DEFAULT_AUDIENCE))
+        token = cast(Optional[str], id.detect_credential(_DEFAULT_AUDIENCE))
     except id.IdentityError as exc:
         IdentityError.raise_from_id(exc)
+
+    _AMBIENT_CREDENTIAL = token
+    return token
@@ -0,0 +1,380 @@
+# Copyright 2022 The Sigstore Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import contextlib
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import jwt
+import pretend
+import pytest
+
+from sigstore import _cli
+from sigstore._internal.fulcio.client import ExpiredCertificate
+from sigstore.oidc import ExpiredIdentity
+
+
+@pytest.fixture
+def identity_token():
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "aud": "sigstore",
+            "sub": "fakesubject",
+            "iat": now,
+            "nbf": now,
+            "exp": now + 600,
+            "iss": "https://example.com",
+        },
+        key="definitely not secure",
+    )
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    def _inputs(count):
+        files = []
+        for idx in range(count):
+            file = tmp_path / f"input{idx}.txt"
+            file.write_text(str(idx))
+            files.append(file)
+        return files
+
+    return _inputs
+
+
+@pytest.fixture
+def signing_executor(monkeypatch):
+    """
+    Replaces the CLI's signing executor with one that runs up to 4 inputs at
+    once and calls `on_done(idx, future)` whenever an input's future finishes
+    or is cancelled. `on_done` runs in the worker thread before that worker
+    picks up another input. Returns each input's future, in input order.
+    """
+
+    def _signing_executor(on_done=lambda idx, future: None):
+        futures = []
+
+        class _Executor(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                # Don't run the input until its callback is attached, so that
+                # the callback never runs in the submitting thread.
+                attached = threading.Event()
+
+                def _run():
+                    attached.wait()
+                    return fn(*args, **kwargs)
+
+                future = super().submit(_run)
+                idx = len(futures)
+                future.add_done_callback(lambda future: on_done(idx, future))
+                futures.append(future)
+                attached.set()
+                return future
+
+        monkeypatch.setattr(_cli, "_MAX_SIGNING_WORKERS", 4)
+        monkeypatch.setattr(_cli, "ThreadPoolExecutor", _Executor)
+
+        return futures
+
+    return _signing_executor
+
+
+@pytest.fixture
+def stub_signer(monkeypatch):
+    """
+    Stubs out the production `SigningContext` with a signer that calls
+    `before(idx)` before signing each input, and fails for any input index
+    listed in `failures`. Returns the indices of the inputs signed, in
+    completion order.
+    """
+
+    def _stub_signer(files, failures=None, before=lambda idx: None):
+        failures = failures or {}
+        names = {file.name: idx for idx, file in enumerate(files)}
+        digests = {
+            hashlib.sha256(file.read_bytes()).digest(): idx
+            for idx, file in enumerate(files)
+        }
+        signed = []
+        lock = threading.Lock()
+
+        def _sign(idx):
+            before(idx)
+            with lock:
+                signed.append(idx)
+
+            if idx in failures:
+                raise failures[idx]
+
+            return pretend.stub(
+                signing_certificate=pretend.stub(
+                    public_bytes=lambda encoding: f"cert{idx}".encode()
+                ),
+                log_entry=pretend.stub(log_index=idx),
+                _inner=pretend.stub(
+                    message_signature=pretend.stub(signature=f"sig{idx}".encode())
+                ),
+                to_json=lambda: json.dumps({"input": idx}),
+            )
+
+        signer = pretend.stub(
+            sign_artifact=lambda input_: _sign(digests[input_.digest]),
+            sign_dsse=lambda statement: _sign(names[statement._inner.subjects[0].name]),
+        )
+        signing_ctx = pretend.stub(
+            signer=contextlib.contextmanager(lambda identity: (yield signer))
+        )
+        monkeypatch.setattr(
+            _cli.SigningContext, "production", classmethod(lambda cls: signing_ctx)
+        )
+
+        return signed
+
+    return _stub_signer
+
+
+def _hold_until_cancelled(last):
+    """
+    Returns `before` and `on_done` hooks that keep inputs 1-3 from being
+    signed, and input 0's worker from picking up another input, until every
+    input that hadn't started (up to and including input `last`) has been
+    cancelled.
+    """
+    cancelled = threading.Event()
+
+    def _before(idx):
+        if idx != 0:
+            assert cancelled.wait(timeout=10)
+
+    def _on_done(idx, future):
+        if idx == 0:
+            assert cancelled.wait(timeout=10)
+        elif idx == last and future.cancelled():
+            cancelled.set()
+
+    return _before, _on_done
+
+
+def _written_order(output):
+    return [
+        Path(line.removeprefix("Sigstore bundle written to ")).name
+        for line in output.splitlines()
+        if line.startswith("Sigstore bundle written to ")
+    ]
+
+
+def test_sign_emits_outputs_in_input_order(
+    capsys, sigstore, identity_token, inputs, signing_executor, stub_signer
+):
+    files = inputs(12)
+    later_signed = threading.Event()
+
+    def _before(idx):
+        # Input 0 isn't signed until a later input has been.
+        if idx == 0:
+            assert later_signed.wait(timeout=10)
+
+    def _on_done(idx, future):
+        if idx != 0:
+            later_signed.set()
+
+    signing_executor(_on_done)
+    signed = stub_signer(files, before=_before)
+
+    sigstore("sign", "--identity-token", identity_token, *map(str, files))
+
+    # The stub completes inputs out of order...
+    assert sorted(signed) == list(range(len(files)))
+    assert signed[0] != 0
+
+    # ...but each input's outputs are still emitted in input order.
+    output = capsys.readouterr().out
+    assert _written_order(output) == [f"{f.name}.sigstore.json" for f in files]
+    assert [
+        int(line.rsplit(" ", 1)[-1])
+        for line in output.splitlines()
+        if line.startswith("Transparency log entry created at index: ")
+    ] == list(range(len(files)))
+
+    for idx, file in enumerate(files):
+        bundle = file.parent / f"{file.name}.sigstore.json"
+        assert json.loads(bundle.read_text()) == {"input": idx}
+
+
+def test_attest_emits_outputs_in_input_order(
+    capsys, tmp_path, sigstore, identity_token, inputs, stub_signer
+):
+    files = inputs(6)
+    signed = stub_signer(files)
+
+    predicate = tmp_path / "predicate.json"
+    predicate.write_text(
+        json.dumps(
+            {
+                "builder": {"id": "https://example.com"},
+                "buildType": "https://example.com/build",
+            }
+        )
+    )
+
+    sigstore(
+        "attest",
+        "--identity-token",
+        identity_token,
+        "--predicate",
+        str(predicate),
+        "--predicate-type",
+        "https://slsa.dev/provenance/v0.2",
+        *map(str, files),
+    )
+
+    assert sorted(signed) == list(range(len(files)))
+    output = capsys.readouterr().out
+    assert _written_order(output) == [f"{f.name}.sigstore.json" for f in files]
+
+
+@pytest.mark.parametrize(
+    ("exc", "message"),
+    [
+        (ValueError("signing failed"), None),
+        (ExpiredIdentity(), "Signature failed: identity token has expired"),
+        (
+            ExpiredCertificate(),
+            "Signature failed: Fulcio signing certificate has expired",
+        ),
+    ],
+)
+def test_sign_failure_cancels_remaining_inputs(
+    capsys,
+    sigstore,
+    identity_token,
+    inputs,
+    signing_executor,
+    stub_signer,
+    exc,
+    message,
+):
+    files = inputs(12)
+    before, on_done = _hold_until_cancelled(len(files) - 1)
+    signing_executor(on_done)
+    signed = stub_signer(
+        files, failures={0: exc, 2: ValueError("second failure")}, before=before
+    )
+
+    with pytest.raises(type(exc)) as excinfo:
+        sigstore("sign", "--identity-token", identity_token, *map(str, files))
+    assert excinfo.value is exc
+
+    # Inputs that hadn't started when the failure was seen are never signed.
+    assert set(signed) == {0, 1, 2, 3}
+
+    # Only the first failure is reported, and every input that was signed
+    # successfully still has its outputs emitted, in input order.
+    output = capsys.readouterr().out
+    if message is None:
+        assert "Signature failed" not in output
+    else:
+        assert output.count(message) == 1
+
+    succeeded = [1, 3]
+    assert _written_order(output) == [
+        f"{files[idx].name}.sigstore.json" for idx in succeeded
+    ]
+    for idx, file in enumerate(files):
+        bundle = file.parent / f"{file.name}.sigstore.json"
+        assert bundle.exists() == (idx in succeeded)
+
+
+def test_sign_interrupt_cancels_remaining_inputs(
+    capsys,
+    monkeypatch,
+    sigstore,
+    identity_token,
+    inputs,
+    signing_executor,
+    stub_signer,
+):
+    files = inputs(12)
+    before, on_done = _hold_until_cancelled(len(files) - 1)
+    futures = signing_executor(on_done)
+    signed = stub_signer(files, before=before)
+
+    # Interrupt the first input's emission, but not any after it.
+    emit = _cli._emit_signing_outputs
+    interrupted = []
+
+    def _interrupt(result, outputs):
+        if not interrupted:
+            interrupted.append(result)
+            raise KeyboardInterrupt
+        emit(result, outputs)
+
+    monkeypatch.setattr(_cli, "_emit_signing_outputs", _interrupt)
+
+    with pytest.raises(KeyboardInterrupt):
+        sigstore("sign", "--identity-token", identity_token, *map(str, files))
+
+    # Inputs that hadn't started when we were interrupted are never signed,
+    # and nothing is left signing in the background.
+    assert set(signed) == {0, 1, 2, 3}
+    assert all(future.done() for future in futures)
+    assert all(future.cancelled() for future in futures[4:])
+
+    # The inputs that were signed but not yet emitted still have their
+    # outputs emitted, in input order.
+    succeeded = [1, 2, 3]
+    output = capsys.readouterr().out
+    assert _written_order(output) == [
+        f"{files[idx].name}.sigstore.json" for idx in succeeded
+    ]
+    for idx, file in enumerate(files):
+        bundle = file.parent / f"{file.name}.sigstore.json"
+        assert bundle.exists() == (idx in succeeded)
+
+
+def test_sign_interrupt_during_submission_cancels_remaining_inputs(
+    monkeypatch, sigstore, identity_token, inputs, signing_executor, stub_signer
+):
+    files = inputs(12)
+    before, on_done = _hold_until_cancelled(5)
+    futures = signing_executor(on_done)
+    signed = stub_signer(files, before=before)
+
+    # Interrupt submission once the inputs after the first 4 start queueing.
+    executor = _cli.ThreadPoolExecutor
+
+    class _InterruptingExecutor(executor):
+        def submit(self, fn, /, *args, **kwargs):
+            if len(futures) == 6:
+                raise KeyboardInterrupt
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(_cli, "ThreadPoolExecutor", _InterruptingExecutor)
+
+    with pytest.raises(KeyboardInterrupt):
+        sigstore("sign", "--identity-token", identity_token, *map(str, files))
+
+    # The queued inputs are cancelled rather than signed, and the inputs that
+    # were signed still have their outputs emitted.
+    assert set(signed) == {0, 1, 2, 3}
+    assert all(future.cancelled() for future in futures[4:])
+    for idx, file in enumerate(files):
+        bundle = file.parent / f"{file.name}.sigstore.json"
+        assert bundle.exists() == (idx < 4)
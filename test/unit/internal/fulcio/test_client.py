@@ -12,3 +12,51 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import json
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from sigstore._internal.fulcio.client import (
+    FulcioClientError,
+    _load_pem_chain,
+    _serialize_cert_request,
+)
+
+
+def test_serialize_cert_request():
+    key = ec.generate_private_key(ec.SECP256R1())
+    csr = (
+        x509.CertificateSigningRequestBuilder()
+        .subject_name(x509.Name([]))
+        .sign(key, hashes.SHA256())
+    )
+
+    payload = _serialize_cert_request(csr)
+    assert isinstance(payload, bytes)
+
+    pem = base64.b64decode(json.loads(payload)["certificateSigningRequest"])
+    assert x509.load_pem_x509_csr(pem) == csr
+
+
+def test_load_pem_chain(asset):
+    pems = [
+        asset(f"x509/{name}").read_text()
+        for name in ("bogus-leaf.pem", "bogus-intermediate.pem", "bogus-root.pem")
+    ]
+
+    chain = _load_pem_chain(pems)
+    assert [c.public_bytes(serialization.Encoding.PEM).decode() for c in chain] == [
+        pem.strip() + "\n" for pem in pems
+    ]
+
+
+@pytest.mark.parametrize("junk", ["", "not a certificate"])
+def test_load_pem_chain_malformed(asset, junk):
+    pems = [asset("x509/bogus-leaf.pem").read_text(), junk]
+
+    with pytest.raises(FulcioClientError, match="malformed certificates"):
+        _load_pem_chain(pems)
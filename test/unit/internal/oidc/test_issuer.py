@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pretend
 import pytest
+import requests
 
+from sigstore import oidc
 from sigstore.oidc import IdentityError, Issuer, IssuerError
 
 
@@ -34,3 +37,58 @@ def test_get_identity_token_bad_code(monkeypatch):
 
     with pytest.raises(IdentityError, match=r"^Token request failed with .+$"):
         Issuer.staging().identity_token(force_oob=True)
+
+
+@pytest.fixture
+def oidc_config_get(monkeypatch):
+    """
+    Empties the OIDC configuration cache and stubs out configuration
+    retrieval. Returns the recorder for the stubbed `Session.get`.
+    """
+    monkeypatch.setattr(oidc, "_OIDC_CONFIG_CACHE", {})
+
+    resp = pretend.stub(
+        raise_for_status=lambda: None,
+        json=lambda: {
+            "authorization_endpoint": "https://issuer.example.com/auth",
+            "token_endpoint": "https://issuer.example.com/token",
+        },
+    )
+    get = pretend.call_recorder(lambda *a, **kw: resp)
+    monkeypatch.setattr(requests.Session, "get", get)
+
+    return get
+
+
+def test_init_caches_oidc_config(oidc_config_get):
+    first = Issuer("https://issuer.example.com")
+    second = Issuer("https://issuer.example.com")
+
+    assert len(oidc_config_get.calls) == 1
+    assert first.oidc_config is second.oidc_config
+    assert second.oidc_config.token_endpoint == "https://issuer.example.com/token"
+
+
+def test_oidc_config_cache_evicts(monkeypatch, oidc_config_get):
+    monkeypatch.setattr(oidc, "_OIDC_CONFIG_CACHE_MAXSIZE", 2)
+
+    # The oldest configuration is evicted once the cache is at capacity.
+    for idx in range(3):
+        Issuer(f"https://issuer{idx}.example.com")
+    assert list(oidc._OIDC_CONFIG_CACHE) == [
+        "https://issuer1.example.com",
+        "https://issuer2.example.com",
+    ]
+
+    # Expired configurations are retrieved again, and are evicted whenever a
+    # configuration is retrieved.
+    oidc._OIDC_CONFIG_CACHE.clear()
+    oidc_config_get.calls.clear()
+    monkeypatch.setattr(oidc, "_OIDC_CONFIG_CACHE_MAXSIZE", 8)
+    monkeypatch.setattr(oidc, "_OIDC_CONFIG_TTL", -1)
+    Issuer("https://issuer3.example.com")
+    Issuer("https://issuer3.example.com")
+    assert len(oidc_config_get.calls) == 2
+
+    Issuer("https://issuer4.example.com")
+    assert list(oidc._OIDC_CONFIG_CACHE) == ["https://issuer4.example.com"]
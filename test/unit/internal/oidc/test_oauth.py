@@ -0,0 +1,42 @@
+# Copyright 2022 The Sigstore Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import threading
+
+import pretend
+import requests
+
+from sigstore._internal.oidc.oauth import _OAuthRedirectServer
+
+
+def test_redirect_sets_auth_response_ready():
+    server = _OAuthRedirectServer("sigstore", "", pretend.stub())
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+
+    try:
+        assert not server.auth_response_ready.is_set()
+
+        resp = requests.get(
+            f"{server.base_uri}{server.redirect_path}?code=fakecode", timeout=5
+        )
+        assert resp.status_code == 200
+
+        assert server.auth_response_ready.wait(timeout=5)
+        assert server.auth_response == {"code": ["fakecode"]}
+    finally:
+        server.shutdown()
+        thread.join()
+        server.server_close()
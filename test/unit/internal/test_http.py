@@ -0,0 +1,89 @@
+# Copyright 2022 The Sigstore Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from sigstore._internal import mount_http_adapter
+from sigstore._internal.fulcio.client import FulcioClient
+from sigstore._internal.rekor.client import RekorClient
+from sigstore._internal.timestamp import TimestampAuthorityClient
+from sigstore.oidc import Issuer
+
+
+def _mounted_adapter(scheme="https"):
+    session = Session()
+    mount_http_adapter(session)
+    return session.get_adapter(f"{scheme}://example.com")
+
+
+def test_mount_http_adapter():
+    adapter = _mounted_adapter()
+    assert isinstance(adapter, HTTPAdapter)
+
+    retries = adapter.max_retries
+    assert isinstance(retries, Retry)
+    assert retries.total == 3
+    assert retries.backoff_factor == 0.2
+    assert retries.status_forcelist == (500, 502, 503, 504)
+    # Read timeouts and `Retry-After` delays could otherwise block for
+    # several times a request's own timeout.
+    assert retries.read == 0
+    assert not retries.respect_retry_after_header
+    # Only idempotent methods are retried.
+    assert "POST" not in retries.allowed_methods
+    assert "GET" in retries.allowed_methods
+    # The final response is surfaced rather than raised as a `RetryError`.
+    assert not retries.raise_on_status
+
+
+def test_mount_http_adapter_schemes():
+    session = Session()
+    mount_http_adapter(session)
+
+    # HTTPS and HTTP share a single adapter...
+    adapter = session.get_adapter("https://example.com")
+    assert session.get_adapter("http://example.com") is adapter
+
+    # ...but each session gets its own.
+    assert _mounted_adapter() is not adapter
+
+
+@pytest.mark.parametrize("scheme", ["https", "http"])
+@pytest.mark.parametrize(
+    "make_session",
+    [
+        lambda: FulcioClient("https://fulcio.example.com").session,
+        lambda: RekorClient("https://rekor.example.com").session,
+        lambda: TimestampAuthorityClient("https://tsa.example.com").session,
+        lambda: Issuer("https://issuer.example.com").session,
+    ],
+    ids=["fulcio", "rekor", "tsa", "issuer"],
+)
+def test_clients_mount_http_adapter(monkeypatch, make_session, scheme):
+    monkeypatch.setattr(Issuer, "_openid_configuration", lambda self, base_url: None)
+
+    session = make_session()
+    retries = session.get_adapter(f"{scheme}://example.com").max_retries
+
+    expected = _mounted_adapter(scheme).max_retries
+    assert retries.total == expected.total
+    assert retries.backoff_factor == expected.backoff_factor
+    assert retries.read == expected.read
+    assert retries.status_forcelist == expected.status_forcelist
+    assert retries.respect_retry_after_header == expected.respect_retry_after_header
+    assert retries.raise_on_status == expected.raise_on_status
@@ -14,6 +14,7 @@
 
 import datetime
 
+import pretend
 import pytest
 
 from sigstore import oidc
@@ -268,3 +269,65 @@ class TestIdentityToken:
         assert identity.identity == identity_value
         assert identity.issuer == iss
         assert identity.federated_issuer == iss if not fed_iss else fed_iss
+
+
+class TestDetectCredential:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self, monkeypatch):
+        monkeypatch.setattr(oidc, "_AMBIENT_CREDENTIAL", None)
+
+    def test_reuses_unexpired_credential(self, monkeypatch, dummy_jwt):
+        now = int(datetime.datetime.now().timestamp())
+        token = dummy_jwt({"exp": now + 600})
+
+        detect = pretend.call_recorder(lambda aud: token)
+        monkeypatch.setattr(oidc.id, "detect_credential", detect)
+
+        assert oidc.detect_credential() == token
+        assert oidc.detect_credential() == token
+        assert detect.calls == [pretend.call("sigstore")]
+
+    @pytest.mark.parametrize("exp_offset", [-600, 0, 30])
+    def test_refreshes_expiring_credential(self, monkeypatch, dummy_jwt, exp_offset):
+        now = int(datetime.datetime.now().timestamp())
+        token = dummy_jwt({"exp": now + exp_offset})
+
+        detect = pretend.call_recorder(lambda aud: token)
+        monkeypatch.setattr(oidc.id, "detect_credential", detect)
+
+        assert oidc.detect_credential() == token
+        assert oidc.detect_credential() == token
+        assert len(detect.calls) == 2
+
+    @pytest.mark.parametrize(
+        "exp", [None, True, "9999999999", {"exp": 9999999999}], ids=repr
+    )
+    def test_does_not_cache_invalid_exp(self, monkeypatch, dummy_jwt, exp):
+        claims = {"exp": exp} if exp is not None else {}
+        token = dummy_jwt(claims)
+
+        detect = pretend.call_recorder(lambda aud: token)
+        monkeypatch.setattr(oidc.id, "detect_credential", detect)
+
+        assert oidc.detect_credential() == token
+        assert oidc.detect_credential() == token
+        assert len(detect.calls) == 2
+
+    @pytest.mark.parametrize("token", [None, "not a jwt"])
+    def test_does_not_cache_unusable_credential(self, monkeypatch, token):
+        detect = pretend.call_recorder(lambda aud: token)
+        monkeypatch.setattr(oidc.id, "detect_credential", detect)
+
+        assert oidc.detect_credential() == token
+        assert oidc.detect_credential() == token
+        assert len(detect.calls) == 2
+
+    def test_wraps_id_errors(self, monkeypatch):
+        monkeypatch.setattr(
+            oidc.id,
+            "detect_credential",
+            pretend.raiser(oidc.id.IdentityError("no credential")),
+        )
+
+        with pytest.raises(oidc.IdentityError, match="no credential"):
+            oidc.detect_credential()